@@ -0,0 +1,265 @@
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Set, Tuple
+
+from domain.models import Signal
+
+# Model writes recorded by the parser and the built-in signals Django dispatches for them
+WRITE_SIGNALS = {
+    "save": ("pre_save", "post_save"),
+    "delete": ("pre_delete", "post_delete"),
+}
+
+
+def _popcount(mask: int) -> int:
+    if hasattr(mask, "bit_count"):  # Python 3.10+
+        return mask.bit_count()
+    return bin(mask).count("1")
+
+
+class Trigger(NamedTuple):
+    signal: str
+    sender: str
+
+    def __str__(self) -> str:
+        return f"{self.signal}({self.sender})"
+
+
+class CascadeMetrics(NamedTuple):
+    trigger: Trigger
+    direct_receivers: int
+    total_receivers: int
+    triggered: int
+    depth: int
+    cyclic: bool
+
+
+class CascadeGraph:
+    """
+    Graph of signal dispatches triggering further dispatches through their receivers.
+    Nodes are (signal, sender) triggers that have receivers; a receiver that saves or
+    deletes a model, or sends a signal, links its trigger to the triggers it fires.
+    Cycles are collapsed into strongly connected components once. Closure sizes are
+    computed for all components in one sweep over bitmasks, each mask dropped as soon
+    as every component depending on it is done, and memoized with the depths.
+    """
+
+    def __init__(self, signals: Iterable[Signal]):
+        self.receivers: Dict[Trigger, List[Signal]] = {}
+        by_signal: Dict[str, List[Trigger]] = {}
+        for s in signals:
+            trigger = Trigger(s.name, s.sender)
+            if trigger not in self.receivers:
+                self.receivers[trigger] = []
+                by_signal.setdefault(s.name, []).append(trigger)
+            self.receivers[trigger].append(s)
+        self._by_signal = by_signal
+        self.successors: Dict[Trigger, FrozenSet[Trigger]] = {
+            trigger: frozenset(t for r in receivers for t in self.effects(r))
+            for trigger, receivers in self.receivers.items()
+        }
+        self._find_components()
+        self._trigger_ids = {trigger: i for i, trigger in enumerate(self.receivers)}
+        self._receiver_rows: Dict[Trigger, Tuple[int, int]] = {}
+        row = 0
+        for trigger, receivers in self.receivers.items():
+            self._receiver_rows[trigger] = (row, len(receivers))
+            row += len(receivers)
+        self._closure_sizes: Dict[int, Tuple[int, int]] = {}
+        self._closures: Dict[int, FrozenSet[Trigger]] = {}
+        self._depths: Dict[int, int] = {}
+
+    def effects(self, receiver: Signal) -> Set[Trigger]:
+        """Triggers with receivers that are fired directly by a receiver's body."""
+        fired = set()
+        for write in receiver.writes:
+            for name in WRITE_SIGNALS.get(write.action, ()):
+                trigger = Trigger(name, write.model)
+                if trigger in self.receivers:
+                    fired.add(trigger)
+        for send in receiver.sends:
+            if send.sender is None:
+                # Unknown sender: any receiver of the signal may run
+                fired.update(self._by_signal.get(send.signal, ()))
+            elif Trigger(send.signal, send.sender) in self.receivers:
+                fired.add(Trigger(send.signal, send.sender))
+        return fired
+
+    def _find_components(self):
+        """Iterative Tarjan; components are numbered in reverse topological order (sinks first)."""
+        self._component: Dict[Trigger, int] = {}
+        self._members: List[List[Trigger]] = []
+        index: Dict[Trigger, int] = {}
+        lowlink: Dict[Trigger, int] = {}
+        stack: List[Trigger] = []
+        on_stack: Set[Trigger] = set()
+        for root in self.receivers:
+            if root in index:
+                continue
+            work = [(root, iter(self.successors[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                for succ in successors:
+                    if succ not in index:
+                        index[succ] = lowlink[succ] = len(index)
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(self.successors[succ])))
+                        break
+                    if succ in on_stack:
+                        lowlink[node] = min(lowlink[node], index[succ])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            self._component[member] = len(self._members)
+                            members.append(member)
+                            if member == node:
+                                break
+                        self._members.append(members)
+        self._component_successors = [
+            {self._component[s] for m in members for s in self.successors[m]} for members in self._members
+        ]
+        self._cyclic = [
+            len(members) > 1 or members[0] in self.successors[members[0]] for members in self._members
+        ]
+
+    def _pending(self, component: int, cache: Dict[int, object]) -> List[int]:
+        """Uncached components reachable from component, successors before predecessors."""
+        seen = {component}
+        todo = [component]
+        while todo:
+            for succ in self._component_successors[todo.pop()]:
+                if succ not in seen and succ not in cache:
+                    seen.add(succ)
+                    todo.append(succ)
+        return sorted(c for c in seen if c not in cache)
+
+    def _reach_masks(self, component: int) -> Tuple[int, int]:
+        """Bitmasks of a component's own triggers and receivers."""
+        triggers = receivers = 0
+        for member in self._members[component]:
+            triggers |= 1 << self._trigger_ids[member]
+            row, count = self._receiver_rows[member]
+            receivers |= ((1 << count) - 1) << row
+        return triggers, receivers
+
+    def _compute_closure_sizes(self):
+        """Count triggers and receivers reached from every component, sinks first."""
+        dependents = [0] * len(self._members)
+        for c, successors in enumerate(self._component_successors):
+            for succ in successors:
+                if succ != c:
+                    dependents[succ] += 1
+        # Closure plus own members, kept only while some predecessor still needs it
+        reach: Dict[int, Tuple[int, int]] = {}
+        for c, successors in enumerate(self._component_successors):
+            own_triggers, own_receivers = self._reach_masks(c)
+            triggers = own_triggers if self._cyclic[c] else 0
+            receivers = own_receivers if self._cyclic[c] else 0
+            for succ in successors:
+                if succ == c:
+                    continue
+                succ_triggers, succ_receivers = reach[succ]
+                triggers |= succ_triggers
+                receivers |= succ_receivers
+                dependents[succ] -= 1
+                if not dependents[succ]:
+                    del reach[succ]
+            self._closure_sizes[c] = (_popcount(triggers), _popcount(receivers))
+            if dependents[c]:
+                reach[c] = (triggers | own_triggers, receivers | own_receivers)
+
+    def _component_depth(self, component: int) -> int:
+        if component not in self._depths:
+            for c in self._pending(component, self._depths):
+                self._depths[c] = max(
+                    (self._depths[succ] + 1 for succ in self._component_successors[c] if succ != c), default=0
+                )
+        return self._depths[component]
+
+    def closure(self, trigger: Trigger) -> FrozenSet[Trigger]:
+        """
+        Every trigger reachable from trigger in one or more steps (itself only if on a cycle).
+        Memoized per component, since all triggers of a cycle share the same closure.
+        """
+        component = self._component.get(trigger)
+        if component is None:
+            return frozenset()
+        if component not in self._closures:
+            reached: Set[Trigger] = set()
+            todo = [t for m in self._members[component] for t in self.successors[m]]
+            while todo:
+                t = todo.pop()
+                if t not in reached:
+                    reached.add(t)
+                    todo.extend(self.successors[t])
+            self._closures[component] = frozenset(reached)
+        return self._closures[component]
+
+    def nearest(self, trigger: Trigger, limit: int) -> List[Trigger]:
+        """Up to limit other triggers reached from trigger, closest first, without a full closure walk."""
+        seen = {trigger}
+        found: List[Trigger] = []
+        frontier = sorted(self.successors.get(trigger, ()))
+        while frontier and len(found) < limit:
+            next_frontier = []
+            for t in frontier:
+                if t in seen:
+                    continue
+                seen.add(t)
+                found.append(t)
+                if len(found) == limit:
+                    break
+                next_frontier.extend(sorted(self.successors[t]))
+            frontier = next_frontier
+        return found
+
+    def is_cyclic(self, trigger: Trigger) -> bool:
+        return trigger in self._component and self._cyclic[self._component[trigger]]
+
+    def is_cycle_edge(self, source: Trigger, target: Trigger) -> bool:
+        """Whether a dispatch of source firing target is itself part of a cycle."""
+        component = self._component.get(source)
+        return component is not None and component == self._component.get(target) and self._cyclic[component]
+
+    def depth(self, trigger: Trigger) -> int:
+        """Longest chain of further dispatches, counting each cycle as a single step."""
+        if trigger not in self._component:
+            return 0
+        return self._component_depth(self._component[trigger])
+
+    def cycles(self) -> List[List[Trigger]]:
+        return [members for members, cyclic in zip(self._members, self._cyclic) if cyclic]
+
+    def metrics(self, trigger: Trigger) -> CascadeMetrics:
+        direct = len(self.receivers.get(trigger, ()))
+        if trigger not in self._component:
+            return CascadeMetrics(trigger, direct, direct, 0, 0, False)
+        component = self._component[trigger]
+        if not self._closure_sizes:
+            self._compute_closure_sizes()
+        triggered, total = self._closure_sizes[component]
+        cyclic = self._cyclic[component]
+        # A trigger only reaches itself through a cycle; count its own receivers once either way
+        return CascadeMetrics(
+            trigger,
+            direct,
+            total if cyclic else total + direct,
+            triggered - 1 if cyclic else triggered,
+            self._component_depth(component),
+            cyclic,
+        )
+
+    def worst(self, limit: int = 10) -> List[CascadeMetrics]:
+        """Triggers that fire further signals, worst first: cycles, then most receivers run, then depth."""
+        cascades = [self.metrics(t) for t in self.receivers if self.successors[t]]
+        cascades.sort(key=lambda m: (m.cyclic, m.total_receivers, m.depth, m.triggered), reverse=True)
+        return cascades[:limit]
@@ -1,4 +1,14 @@
-from typing import NamedTuple
+from typing import NamedTuple, Optional, Tuple
+
+
+class ModelWrite(NamedTuple):
+    model: str
+    action: str
+
+
+class SignalSend(NamedTuple):
+    signal: str
+    sender: Optional[str]
 
 
 class Signal(NamedTuple):
@@ -6,3 +16,5 @@ class Signal(NamedTuple):
     sender: str
     receiver: str
     file: str
+    writes: Tuple[ModelWrite, ...] = ()
+    sends: Tuple[SignalSend, ...] = ()
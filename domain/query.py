@@ -0,0 +1,417 @@
+import re
+import weakref
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from domain.models import Signal
+
+FIELDS = ("name", "sender", "receiver", "file")
+
+FIELD_ALIASES = {
+    "signal": "name",
+    "name": "name",
+    "sender": "sender",
+    "receiver": "receiver",
+    "file": "file",
+    "path": "file",
+}
+
+KEYWORDS = ("AND", "OR", "NOT")
+
+_SYNTAX_RE = re.compile(
+    r'[()"]|(?:^|\s)(?:AND|OR|NOT)(?:\s|$)|(?:^|[\s(-])(?i:' + "|".join(FIELD_ALIASES) + r"):"
+)
+
+
+class QueryError(ValueError):
+    """Raised when a search query cannot be parsed or compiled."""
+
+
+class Term(NamedTuple):
+    field: Optional[str]
+    op: str
+    value: str
+
+
+class And(NamedTuple):
+    children: Tuple["Node", ...]
+
+
+class Or(NamedTuple):
+    children: Tuple["Node", ...]
+
+
+class Not(NamedTuple):
+    child: "Node"
+
+
+Node = Union[Term, And, Or, Not]
+
+
+class SignalIndex:
+    """
+    Per-column indexes over a list of signals.
+    Each column maps its distinct values to the rows holding them, so exact lookups are a
+    dict access and substring/regex lookups only scan distinct values instead of rows.
+    """
+
+    def __init__(self, signals: Iterable[Signal]):
+        self.signals = list(signals)
+        self.rows = frozenset(range(len(self.signals)))
+        self._exact: Dict[str, Dict[str, Set[int]]] = {field: {} for field in FIELDS}
+        self._folded: Dict[str, Dict[str, Set[int]]] = {field: {} for field in FIELDS}
+        for row, s in enumerate(self.signals):
+            for field in FIELDS:
+                value = getattr(s, field)
+                self._exact[field].setdefault(value, set()).add(row)
+                self._folded[field].setdefault(value.lower(), set()).add(row)
+        self._sorted_keys = {field: sorted(self._exact[field]) for field in FIELDS}
+        self._sorted_folded = {field: sorted(self._folded[field]) for field in FIELDS}
+
+    def distinct_count(self, field: str) -> int:
+        return len(self._exact[field])
+
+    def exact(self, field: str, value: str, case_sensitive: bool) -> Set[int]:
+        if case_sensitive:
+            return set(self._exact[field].get(value, ()))
+        return set(self._folded[field].get(value.lower(), ()))
+
+    def prefix(self, field: str, value: str, case_sensitive: bool) -> Set[int]:
+        keys = self._sorted_keys[field] if case_sensitive else self._sorted_folded[field]
+        postings = self._exact[field] if case_sensitive else self._folded[field]
+        needle = value if case_sensitive else value.lower()
+        rows: Set[int] = set()
+        for i in range(bisect_left(keys, needle), len(keys)):
+            if not keys[i].startswith(needle):
+                break
+            rows |= postings[keys[i]]
+        return rows
+
+    def scan(self, field: str, predicate: Callable[[str], bool]) -> Set[int]:
+        rows: Set[int] = set()
+        for value, postings in self._exact[field].items():
+            if predicate(value):
+                rows |= postings
+        return rows
+
+    def value(self, row: int, field: str) -> str:
+        return getattr(self.signals[row], field)
+
+    def select(self, rows: Iterable[int]) -> List[Signal]:
+        return [self.signals[row] for row in sorted(rows)]
+
+
+class _Plan:
+    """Base class of compiled query steps."""
+
+    cost = 0
+
+    def evaluate(self, index: SignalIndex, candidates: Optional[Set[int]] = None) -> Set[int]:
+        raise NotImplementedError
+
+
+class _MatchAll(_Plan):
+    def evaluate(self, index, candidates=None):
+        return set(index.rows if candidates is None else candidates)
+
+
+class _Exact(_Plan):
+    cost = 1
+
+    def __init__(self, field: str, value: str, case_sensitive: bool):
+        self.field = field
+        self.value = value
+        self.case_sensitive = case_sensitive
+
+    def evaluate(self, index, candidates=None):
+        rows = index.exact(self.field, self.value, self.case_sensitive)
+        return rows if candidates is None else rows & candidates
+
+
+class _Prefix(_Plan):
+    cost = 2
+
+    def __init__(self, field: str, value: str, case_sensitive: bool):
+        self.field = field
+        self.value = value
+        self.case_sensitive = case_sensitive
+
+    def evaluate(self, index, candidates=None):
+        rows = index.prefix(self.field, self.value, self.case_sensitive)
+        return rows if candidates is None else rows & candidates
+
+
+class _Scan(_Plan):
+    """Unindexable predicate: scans distinct column values, or only the candidate rows when fewer."""
+
+    cost = 3
+
+    def __init__(self, field: str, predicate: Callable[[str], bool]):
+        self.field = field
+        self.predicate = predicate
+
+    def evaluate(self, index, candidates=None):
+        if candidates is not None and len(candidates) < index.distinct_count(self.field):
+            return {row for row in candidates if self.predicate(index.value(row, self.field))}
+        rows = index.scan(self.field, self.predicate)
+        return rows if candidates is None else rows & candidates
+
+
+class _Union(_Plan):
+    def __init__(self, children: List[_Plan]):
+        self.children = children
+        self.cost = max(child.cost for child in children)
+
+    def evaluate(self, index, candidates=None):
+        rows: Set[int] = set()
+        for child in self.children:
+            rows |= child.evaluate(index, candidates)
+        return rows
+
+
+class _Intersection(_Plan):
+    def __init__(self, children: List[_Plan]):
+        # Cheapest steps first, so costly scans only see the rows that survived the lookups
+        self.children = sorted(children, key=lambda child: child.cost)
+        self.cost = self.children[0].cost
+
+    def evaluate(self, index, candidates=None):
+        rows = candidates
+        for child in self.children:
+            rows = child.evaluate(index, rows)
+            if not rows:
+                return set()
+        return rows
+
+
+class _Difference(_Plan):
+    def __init__(self, child: _Plan):
+        self.child = child
+        self.cost = child.cost + 1
+
+    def evaluate(self, index, candidates=None):
+        universe = set(index.rows if candidates is None else candidates)
+        return universe - self.child.evaluate(index, universe)
+
+
+class SignalQuery:
+    """
+    A parsed and compiled search query.
+    The same instance drives the table and the graph, and remembers its result per
+    index so evaluating it again against the same index is free.
+    """
+
+    def __init__(self, text: str, tree: Optional[Node], plan: _Plan):
+        self.text = text
+        self.tree = tree
+        self.plan = plan
+        # Weak keys, so cached queries do not keep replaced indexes and their signals alive
+        self._results: "weakref.WeakKeyDictionary[SignalIndex, FrozenSet[int]]" = weakref.WeakKeyDictionary()
+
+    def evaluate(self, index: SignalIndex) -> FrozenSet[int]:
+        rows = self._results.get(index)
+        if rows is None:
+            rows = frozenset(self.plan.evaluate(index))
+            self._results[index] = rows
+        return rows
+
+    def filter(self, index: SignalIndex) -> List[Signal]:
+        return index.select(self.evaluate(index))
+
+
+def _tokenize(text: str) -> List[Tuple[str, str, bool]]:
+    """Split a query into (kind, text, quoted) tokens; kind is "(", ")", a keyword or "term"."""
+    tokens = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch.isspace():
+            i += 1
+            continue
+        if ch in "()":
+            tokens.append((ch, ch, False))
+            i += 1
+            continue
+        start = i
+        quoted = False
+        while i < len(text) and not text[i].isspace() and text[i] not in "()":
+            if text[i] == '"':
+                quoted = True
+                i += 1
+                while i < len(text) and text[i] != '"':
+                    i += 2 if text[i] == "\\" else 1
+                if i >= len(text):
+                    raise QueryError(f"Unterminated quote at position {start}")
+                i += 1
+            else:
+                i += 1
+        raw = text[start:i]
+        if not quoted and raw in KEYWORDS:
+            tokens.append((raw, raw, False))
+        elif raw == "-" and text[i:i + 1] == "(":
+            # `-(...)` negates the group, like `NOT (...)`
+            tokens.append(("NOT", raw, False))
+        else:
+            tokens.append(("term", raw, quoted))
+    return tokens
+
+
+def _parse_term(raw: str) -> Node:
+    negate = raw.startswith("-") and len(raw) > 1
+    if negate:
+        raw = raw[1:]
+    field = None
+    head, sep, rest = raw.partition(":")
+    if sep and '"' not in head:
+        if head.lower() not in FIELD_ALIASES:
+            raise QueryError(f"Unknown field '{head}' (expected one of: {', '.join(sorted(FIELD_ALIASES))})")
+        field = FIELD_ALIASES[head.lower()]
+        raw = rest
+    op = ""
+    if raw[:1] in ("~", "="):
+        op, raw = raw[0], raw[1:]
+    if raw.startswith('"') and raw.endswith('"') and len(raw) >= 2:
+        value = raw[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    else:
+        value = raw
+    if field is not None and not value and op:
+        raise QueryError(f"Missing value after '{head}:{op}'")
+    term = Term(field, op, value)
+    return Not(term) if negate else term
+
+
+class _Parser:
+    def __init__(self, tokens: List[Tuple[str, str, bool]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def take(self) -> Tuple[str, str, bool]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Optional[Node]:
+        if not self.tokens:
+            return None
+        node = self.parse_or()
+        if self.pos < len(self.tokens):
+            raise QueryError(f"Unexpected '{self.tokens[self.pos][1]}'")
+        return node
+
+    def parse_or(self) -> Node:
+        children = [self.parse_and()]
+        while self.peek() == "OR":
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Or(tuple(children))
+
+    def parse_and(self) -> Node:
+        children = [self.parse_unary()]
+        while self.peek() not in (None, "OR", ")"):
+            if self.peek() == "AND":
+                self.take()
+            children.append(self.parse_unary())
+        return children[0] if len(children) == 1 else And(tuple(children))
+
+    def parse_unary(self) -> Node:
+        kind = self.peek()
+        if kind is None:
+            raise QueryError("Unexpected end of query")
+        if kind == "NOT":
+            self.take()
+            return Not(self.parse_unary())
+        if kind == "(":
+            self.take()
+            node = self.parse_or()
+            if self.peek() != ")":
+                raise QueryError("Missing closing parenthesis")
+            self.take()
+            return node
+        if kind == "term":
+            return _parse_term(self.take()[1])
+        raise QueryError(f"Unexpected '{self.take()[1]}'")
+
+
+def parse_query(text: str) -> Optional[Node]:
+    """
+    Parse a search query into a syntax tree, or None for an empty query.
+
+    Syntax: bare words match any column; `field:value` restricts a word to one column
+    (signal, sender, receiver, file); `field:=value` matches the whole value,
+    `value*` matches a prefix and `field:~pattern` is a regular expression
+    (quote patterns containing spaces or parentheses). Words are combined with AND (implicit),
+    OR and NOT (or a leading `-`, also before a group), and can be grouped with parentheses.
+    """
+    return _Parser(_tokenize(text)).parse()
+
+
+def _substring_steps(fields: Tuple[str, ...], value: str, case_sensitive: bool) -> List[_Plan]:
+    needle = value if case_sensitive else value.lower()
+    if case_sensitive:
+        return [_Scan(field, lambda v, n=needle: n in v) for field in fields]
+    return [_Scan(field, lambda v, n=needle: n in v.lower()) for field in fields]
+
+
+def _compile_term(term: Term, case_sensitive: bool, word_match: bool) -> _Plan:
+    fields = FIELDS if term.field is None else (term.field,)
+    if term.op == "~":
+        try:
+            pattern = re.compile(term.value, 0 if case_sensitive else re.IGNORECASE)
+        except re.error as exc:
+            raise QueryError(f"Invalid regular expression '{term.value}': {exc}") from exc
+        steps: List[_Plan] = [_Scan(field, lambda v, p=pattern: p.search(v) is not None) for field in fields]
+    elif term.op == "=":
+        steps = [_Exact(field, term.value, case_sensitive) for field in fields]
+    elif not term.value:
+        # e.g. a `sender:` still being typed; matches everything in every mode
+        return _MatchAll()
+    elif term.value.endswith("*"):
+        # An explicit prefix wins over whole-word mode
+        steps = [_Prefix(field, term.value[:-1], case_sensitive) for field in fields]
+    elif word_match:
+        steps = [_Exact(field, term.value, case_sensitive) for field in fields]
+    else:
+        steps = _substring_steps(fields, term.value, case_sensitive)
+    return steps[0] if len(steps) == 1 else _Union(steps)
+
+
+def _compile(node: Node, case_sensitive: bool, word_match: bool) -> _Plan:
+    if isinstance(node, Term):
+        return _compile_term(node, case_sensitive, word_match)
+    if isinstance(node, Not):
+        return _Difference(_compile(node.child, case_sensitive, word_match))
+    children = [_compile(child, case_sensitive, word_match) for child in node.children]
+    if isinstance(node, And):
+        return _Intersection(children)
+    return _Union(children)
+
+
+@lru_cache(maxsize=128)
+def compile_query(text: str, case_sensitive: bool = False, word_match: bool = False) -> SignalQuery:
+    """
+    Parse and compile a search query into an evaluation plan.
+    Exact (`=`, or whole-word mode) and prefix (`value*`) terms use the column indexes;
+    substring and regex terms fall back to scanning, restricted to the rows left by the
+    indexed terms of the same AND group. Raises QueryError on malformed queries.
+    """
+    tree = parse_query(text)
+    plan = _MatchAll() if tree is None else _compile(tree, case_sensitive, word_match)
+    return SignalQuery(text, tree, plan)
+
+
+def has_query_syntax(text: str) -> bool:
+    """Whether text uses any query syntax (known fields, keywords, parentheses or quotes)."""
+    return _SYNTAX_RE.search(text) is not None
+
+
+def literal_query(text: str, case_sensitive: bool = False, word_match: bool = False) -> SignalQuery:
+    """Compile text as a single free-text term across all columns, ignoring query syntax."""
+    if word_match:
+        steps = [_Exact(field, text, case_sensitive) for field in FIELDS]
+    else:
+        steps = _substring_steps(FIELDS, text, case_sensitive)
+    return SignalQuery(text, Term(None, "", text), _Union(steps))
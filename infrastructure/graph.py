@@ -3,12 +3,38 @@ from typing import List
 
 from graphviz import Digraph
 
+from domain.cascade import CascadeGraph, Trigger
 from domain.models import Signal
 
 
-def generate_signals_graph(signals: List[Signal], output_path: str = None) -> str:
+def _add_cascades(dot: Digraph, signals: List[Signal], cascades: CascadeGraph = None, limit: int = 5) -> None:
+    """
+    Add an edge from each receiver to the signals its model writes or sends fire,
+    and list the worst cascades in the graph label. Edges on a cycle are red.
+    """
+    if cascades is None:
+        cascades = CascadeGraph(signals)
+    for s in signals:
+        receiver_id = f"receiver_{s.receiver}_{os.path.basename(s.file)}"
+        source = Trigger(s.name, s.sender)
+        for trigger in cascades.effects(s):
+            color = "#d32f2f" if cascades.is_cycle_edge(source, trigger) else "#f57c00"
+            for t in cascades.receivers[trigger]:
+                signal_id = f"signal_{t.name}_{t.sender}_{t.receiver}_{os.path.basename(t.file)}"
+                dot.edge(receiver_id, signal_id, label="triggers", style="dashed", color=color)
+    worst = cascades.worst(limit)
+    if worst:
+        lines = ["Worst signal cascades:"]
+        for m in worst:
+            cycle = ", cycle" if m.cyclic else ""
+            lines.append(f"{m.trigger}: {m.total_receivers} receivers, depth {m.depth}{cycle}")
+        dot.attr(label="\\l".join(lines) + "\\l", labelloc="t")
+
+
+def generate_signals_graph(signals: List[Signal], output_path: str = None, cascades: CascadeGraph = None) -> str:
     """
     Generate a Graphviz diagram from the list of signals and receivers.
+    Pass an existing CascadeGraph for the signals to avoid rebuilding it.
     Returns the path to the generated PNG file.
     """
     dot = Digraph(comment="Django Signals Flow", format="png")
@@ -25,14 +51,16 @@ def generate_signals_graph(signals: List[Signal], output_path: str = None) -> st
         dot.node(signal_id, signal_label, shape="diamond", style="filled", fillcolor="#c8e6c9")
         dot.edge(sender_id, signal_id, label="send")
         dot.edge(signal_id, receiver_id, label="calls")
+    _add_cascades(dot, signals, cascades)
     output_file = output_path or "signals_flow_diagram"
     png_path = dot.render(output_file, view=False)
     return png_path
 
 
-def generate_signals_dot(signals: List[Signal]) -> str:
+def generate_signals_dot(signals: List[Signal], cascades: CascadeGraph = None) -> str:
     """
     Generate a Graphviz DOT string from the list of signals and receivers.
+    Pass an existing CascadeGraph for the signals to avoid rebuilding it.
     Returns the DOT source as a string.
     """
     dot = Digraph(comment="Django Signals Flow", format="dot")
@@ -49,6 +77,7 @@ def generate_signals_dot(signals: List[Signal]) -> str:
         dot.node(signal_id, signal_label, shape="diamond", style="filled", fillcolor="#c8e6c9")
         dot.edge(sender_id, signal_id, label="send")
         dot.edge(signal_id, receiver_id, label="calls")
+    _add_cascades(dot, signals, cascades)
 
     # Use pydot to run Graphviz layout and get node positions
     import pydot
@@ -1,8 +1,128 @@
 import ast
 import os
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple, Union
 
-from domain.models import Signal
+from domain.models import ModelWrite, Signal, SignalSend
+
+MANAGER_ATTRS = ("objects", "_default_manager")
+SAVE_METHODS = (
+    "save",
+    "create",
+    "get_or_create",
+    "update_or_create",
+    "asave",
+    "acreate",
+    "aget_or_create",
+    "aupdate_or_create",
+)
+DELETE_METHODS = ("delete", "adelete")
+SEND_METHODS = ("send", "send_robust")
+
+
+def _resolve_name(name: str, models: Dict[str, str]) -> Optional[str]:
+    if name in models:
+        return models[name]
+    return name if name[:1].isupper() else None
+
+
+def _manager_model(expr: ast.AST, models: Dict[str, str]) -> Optional[str]:
+    """Return the model behind a `Model.objects...` chain, e.g. `Order.objects.filter(...).first()`."""
+    while isinstance(expr, (ast.Call, ast.Attribute)):
+        if isinstance(expr, ast.Attribute) and expr.attr in MANAGER_ATTRS:
+            return _resolve_name(expr.value.id, models) if isinstance(expr.value, ast.Name) else None
+        expr = expr.func if isinstance(expr, ast.Call) else expr.value
+    return None
+
+
+def _model_of(expr: ast.AST, models: Dict[str, str]) -> Optional[str]:
+    """Best-effort static type of an expression holding a model instance or queryset."""
+    if isinstance(expr, ast.Await):
+        expr = expr.value
+    if isinstance(expr, ast.Name):
+        return models.get(expr.id)
+    if isinstance(expr, ast.Call) and isinstance(expr.func, ast.Name) and expr.func.id[:1].isupper():
+        return expr.func.id
+    return _manager_model(expr, models)
+
+
+def _send_sender(call: ast.Call, models: Dict[str, str]) -> Optional[str]:
+    value = next((kw.value for kw in call.keywords if kw.arg == "sender"), call.args[0] if call.args else None)
+    if isinstance(value, ast.Name):
+        return _resolve_name(value.id, models)
+    if isinstance(value, ast.Attribute) and value.attr == "__class__":
+        return _model_of(value.value, models)
+    if isinstance(value, ast.Attribute):
+        return value.attr
+    return None
+
+
+def _signal_definitions(tree: ast.AST) -> Set[str]:
+    """Names bound to `Signal()` instances in a module."""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        else:
+            continue
+        if not isinstance(value, ast.Call):
+            continue
+        if getattr(value.func, "id", None) != "Signal" and getattr(value.func, "attr", None) != "Signal":
+            continue
+        for target in targets:
+            name = getattr(target, "id", None) or getattr(target, "attr", None)
+            if name:
+                names.add(name)
+    return names
+
+
+def parse_receiver_effects(
+    func: Union[ast.FunctionDef, ast.AsyncFunctionDef], sender: str
+) -> Tuple[Tuple[ModelWrite, ...], Tuple[SignalSend, ...]]:
+    """
+    Statically collect the model writes and explicit signal sends in a receiver body.
+    Variables are typed from `Model(...)`, `Model.objects...` (including loops over
+    querysets) and the receiver's own `sender`/`instance` arguments; writes on values of
+    unknown type are ignored. Sends are recorded for any name; parse_signals keeps only
+    those on known project signals.
+    """
+    models = {"sender": sender, "instance": sender}
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        elif isinstance(node, (ast.For, ast.AsyncFor)):
+            # `for obj in Model.objects.filter(...)`
+            targets, value = [node.target], node.iter
+        else:
+            continue
+        model = _model_of(value, models)
+        if model is None:
+            continue
+        for target in targets:
+            # `obj, created = Model.objects.get_or_create(...)`
+            if isinstance(target, ast.Tuple) and target.elts:
+                target = target.elts[0]
+            if isinstance(target, ast.Name):
+                models[target.id] = model
+    writes = []
+    sends = []
+    for node in ast.walk(func):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        method = node.func.attr
+        target = node.func.value
+        if method in SAVE_METHODS or method in DELETE_METHODS:
+            model = _model_of(target, models)
+            if model:
+                writes.append(ModelWrite(model, "delete" if method in DELETE_METHODS else "save"))
+        elif method in SEND_METHODS and (node.args or node.keywords):
+            name = getattr(target, "id", None) or getattr(target, "attr", None)
+            if name:
+                sends.append(SignalSend(name, _send_sender(node, models)))
+    return tuple(dict.fromkeys(writes)), tuple(dict.fromkeys(sends))
 
 
 def parse_signals(project_root: str) -> List[Signal]:
@@ -11,6 +131,8 @@ def parse_signals(project_root: str) -> List[Signal]:
     Returns a list of Signal domain objects.
     """
     signals = []
+    # Signals defined with Signal() or listened to with @receiver; only sends on these count
+    known_signals = set()
     for dirpath, _, filenames in os.walk(project_root):
         for filename in filenames:
             if not filename.endswith(".py"):
@@ -21,8 +143,9 @@ def parse_signals(project_root: str) -> List[Signal]:
                     tree = ast.parse(file.read(), filename=filename)
             except Exception:
                 continue
+            known_signals |= _signal_definitions(tree)
             for node in ast.walk(tree):
-                if not isinstance(node, ast.FunctionDef):
+                if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                     continue
                 for deco in node.decorator_list:
                     if not (isinstance(deco, ast.Call) and getattr(deco.func, "id", "") == "receiver"):
@@ -36,6 +159,13 @@ def parse_signals(project_root: str) -> List[Signal]:
                             sender = getattr(kw.value, "id", None)
                             if sender is None and hasattr(kw.value, "attr"):
                                 sender = kw.value.attr
+                    if signal:
+                        known_signals.add(signal)
                     if signal and sender:
-                        signals.append(Signal(signal, sender, node.name, filepath))
-    return signals
+                        writes, sends = parse_receiver_effects(node, sender)
+                        signals.append(Signal(signal, sender, node.name, filepath, writes, sends))
+    # Signals may be defined in files walked after their senders, so filter sends at the end
+    return [
+        s._replace(sends=tuple(send for send in s.sends if send.signal in known_signals)) if s.sends else s
+        for s in signals
+    ]
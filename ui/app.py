@@ -1,5 +1,6 @@
 from typing import List
 
+from PyQt6 import sip
 from PyQt6.QtWidgets import (
     QApplication,
     QHBoxLayout,
@@ -13,7 +14,10 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from domain.cascade import CascadeGraph
 from domain.models import Signal
+from domain.query import QueryError, SignalIndex, SignalQuery, compile_query, has_query_syntax, literal_query
+from ui.widgets.cascades import SignalCascadesWidget
 from ui.widgets.details import SignalDetailsWidget
 from ui.widgets.graph_scene import SignalsGraphScene
 from ui.widgets.graphics import ZoomableGraphicsView
@@ -24,6 +28,11 @@ class SignalsViewerApp:
 
     def __init__(self, signals: List[Signal]):
         self.signals = signals
+        self.index = SignalIndex(self.signals)
+        self.last_query = compile_query("")
+        self.applied_query = self.last_query
+        # Built on first use of the cascades panel
+        self.cascades = None
         self.window = QMainWindow()
         self.window.setWindowTitle("Django Signals Explorer")
         self.window.resize(1000, 600)
@@ -32,32 +41,32 @@ class SignalsViewerApp:
         self.graph_view = ZoomableGraphicsView()
         self.graph_scene = SignalsGraphScene(self.signals)
         self.graph_view.setScene(self.graph_scene)
+        self.graph_scene.selectionChanged.connect(self.on_node_selected)
+        self.graph_scene.nodeSelectionChanged.connect(self.on_node_selected)
         self.graph_view.setVisible(False)
         self.detail_label = SignalDetailsWidget()
         self.detail_label.setVisible(False)
         self.toggle_button = QPushButton("Show Graph")
         self.toggle_button.clicked.connect(self.toggle_view)
+        self.cascade_view = SignalCascadesWidget()
+        self.cascade_button = QPushButton("Show Cascades")
+        self.cascade_button.setToolTip("Receivers whose model writes or sends fire further signals")
+        self.cascade_button.clicked.connect(self.toggle_cascades)
         layout = QVBoxLayout()
         layout.addWidget(QLabel("Django Signals Explorer"))
         layout.addWidget(self.toggle_button)
+        layout.addWidget(self.cascade_button)
         layout.addWidget(search_widget)
         layout.addWidget(self.tree)
         layout.addWidget(self.graph_view)
         layout.addWidget(self.detail_label)
+        layout.addWidget(self.cascade_view)
         container = QWidget()
         container.setLayout(layout)
         self.window.setCentralWidget(container)
         self.is_graph_view = False
         self.populate_tree(self.signals)
 
-    @staticmethod
-    def _match(val: str, text: str, case_sensitive: bool, word_match: bool) -> bool:
-        cmp_val = val if case_sensitive else val.lower()
-        cmp_text = text if case_sensitive else text.lower()
-        if word_match:
-            return cmp_val == cmp_text
-        return cmp_text in cmp_val
-
     def _create_tree(self) -> QTreeWidget:
         tree = QTreeWidget()
         tree.setHeaderLabels(["Signal", "Sender", "Receiver", "File"])
@@ -65,7 +74,7 @@ class SignalsViewerApp:
 
     def _create_search_widgets(self):
         search = QLineEdit()
-        search.setPlaceholderText("Search signals, senders, receivers, or files...")
+        search.setPlaceholderText("Search, e.g. sender:Order signal:post_save OR receiver:~notify NOT file:tests/")
         case_btn = QPushButton("Aa")
         case_btn.setCheckable(True)
         case_btn.setToolTip("Case sensitive search")
@@ -88,9 +97,7 @@ class SignalsViewerApp:
     def toggle_view(self):
         if not self.is_graph_view:
             # When switching to graph, filter signals and update graph scene
-            filtered_signals = self._get_filtered_signals()
-            self.graph_scene.signals = filtered_signals
-            self.graph_scene.draw_graph()
+            self.graph_scene.apply_filter(self._current_query(), self.index)
             self.graph_view.setVisible(True)
             self.tree.setVisible(False)
             self.search.setVisible(True)
@@ -105,83 +112,48 @@ class SignalsViewerApp:
             self.graph_scene.clearSelection()
             self.detail_label.setVisible(False)
             self.populate_tree(self.signals)
+            self._hide_unmatched_rows(self._current_query())
+
+    def toggle_cascades(self):
+        visible = self.cascade_view.isHidden()
+        if visible and self.cascades is None:
+            self.cascades = CascadeGraph(self.signals)
+            self.cascade_view.show_cascades(self.cascades)
+        self.cascade_view.setVisible(visible)
+        self.cascade_button.setText("Hide Cascades" if visible else "Show Cascades")
 
     def filter_tree(self, _=None):
-        text = self.search.text()
-        case_sensitive = self.case_btn.isChecked()
-        word_match = self.word_btn.isChecked()
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            visible = any(self._match(item.text(col), text, case_sensitive, word_match) for col in range(4))
-            item.setHidden(not visible)
+        query = self._current_query()
+        if query is self.applied_query:
+            # e.g. an incomplete query still showing the last valid one; nothing to redo
+            return
+        self.applied_query = query
+        self._hide_unmatched_rows(query)
         # Update graph scene signals and redraw if in graph view
         if self.is_graph_view:
-            filtered_signals = self._get_filtered_signals()
-            self.graph_scene.signals = filtered_signals
-            self.graph_scene.draw_graph()
-        self._filter_graph(text, case_sensitive, word_match)
+            self.graph_scene.apply_filter(query, self.index)
 
-    def _get_filtered_signals(self):
+    def _current_query(self) -> SignalQuery:
         text = self.search.text()
         case_sensitive = self.case_btn.isChecked()
         word_match = self.word_btn.isChecked()
-        if not text:
-            return self.signals
-        filtered = []
-        for s in self.signals:
-            if (
-                self._match(s.name, text, case_sensitive, word_match)
-                or self._match(s.sender, text, case_sensitive, word_match)
-                or self._match(s.receiver, text, case_sensitive, word_match)
-                or self._match(s.file, text, case_sensitive, word_match)
-            ):
-                filtered.append(s)
-        return filtered
-
-    def _filter_graph(self, text: str, case_sensitive: bool, word_match: bool):
-        if not self.is_graph_view:
-            return
-        if not text:
-            for item in self.graph_scene.items():
-                item.setOpacity(1.0)
-            return
-        matched_senders = set()
-        for item in self.graph_scene.items():
-            if item.data(0) and item.data(0)[0] == "group_label":
-                sender = item.data(0)[1]
-                if self._match(sender, text, case_sensitive, word_match):
-                    matched_senders.add(sender)
-        for item in self.graph_scene.items():
-            if item.data(0) and item.data(0)[0] == "group_rect":
-                sender = item.data(0)[1]
-                item.setOpacity(1.0 if sender in matched_senders else 0.15)
-            elif item.data(0) and item.data(0)[0] == "group_label":
-                sender = item.data(0)[1]
-                item.setOpacity(1.0 if sender in matched_senders else 0.15)
-            elif hasattr(item, "boundingRect") and hasattr(item, "pos"):
-                in_matched = False
-                for group in self.graph_scene.items():
-                    if group.data(0) and group.data(0)[0] == "group_rect":
-                        sender = group.data(0)[1]
-                        if sender in matched_senders:
-                            group_rect = group.rect()
-                            node_rect = item.mapRectToScene(item.boundingRect())
-                            if group_rect.contains(node_rect.center()):
-                                in_matched = True
-                                break
-                item.setOpacity(1.0 if in_matched else 0.15)
-            elif hasattr(item, "line"):
-                in_matched = False
-                for group in self.graph_scene.items():
-                    if group.data(0) and group.data(0)[0] == "group_rect":
-                        sender = group.data(0)[1]
-                        if sender in matched_senders:
-                            group_rect = group.rect()
-                            line = item.line()
-                            if group_rect.contains(line.p1()) and group_rect.contains(line.p2()):
-                                in_matched = True
-                                break
-                item.setOpacity(1.0 if in_matched else 0.15)
+        try:
+            query = compile_query(text, case_sensitive, word_match)
+        except QueryError as exc:
+            self.search.setToolTip(str(exc))
+            if has_query_syntax(text):
+                # Most likely still being typed; keep showing the last valid query's results
+                return self.last_query
+            return literal_query(text, case_sensitive, word_match)
+        self.search.setToolTip("")
+        self.last_query = query
+        return query
+
+    def _hide_unmatched_rows(self, query: SignalQuery):
+        # Tree rows are populated in the same order as self.signals, i.e. index rows
+        rows = query.evaluate(self.index)
+        for i in range(self.tree.topLevelItemCount()):
+            self.tree.topLevelItem(i).setHidden(i not in rows)
 
     def populate_tree(self, signals: List[Signal]):
         self.tree.clear()
@@ -196,12 +168,14 @@ class SignalsViewerApp:
 
     def draw_graph(self):
         self.graph_scene.draw_graph()
-        self.graph_scene.selectionChanged.connect(self.on_node_selected)
 
     def on_node_selected(self):
-        selected = [item for item in getattr(self.graph_scene, "node_items", []) if item.isSelected()]
+        if sip.isdeleted(self.graph_scene):
+            # The scene emits selectionChanged while it is destroyed at shutdown
+            return
+        selected = self.graph_scene.selected_node()
         if selected:
-            node_type, node_value = selected[0].data(0)
+            node_type, node_value = selected
             self.detail_label.show_details(node_type, node_value, self.signals)
         else:
             self.detail_label.setVisible(False)
@@ -0,0 +1,50 @@
+from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem
+
+from domain.cascade import CascadeGraph
+
+# Receivers and triggers listed under each cascade before summarizing the rest as a count
+REACHES_SAMPLE = 20
+
+
+class SignalCascadesWidget(QTreeWidget):
+    """Widget listing the worst signal cascades, expandable into the triggers they reach."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHeaderLabels(["Trigger", "Receivers run", "Depth", "Triggered signals", "Cycle"])
+        self.setVisible(False)
+
+    def show_cascades(self, cascades: CascadeGraph, limit: int = 50):
+        self.clear()
+        for metrics in cascades.worst(limit):
+            item = QTreeWidgetItem(
+                [
+                    str(metrics.trigger),
+                    str(metrics.total_receivers),
+                    str(metrics.depth),
+                    str(metrics.triggered),
+                    "yes" if metrics.cyclic else "",
+                ]
+            )
+            firing = 0
+            for receiver in cascades.receivers[metrics.trigger]:
+                fired = cascades.effects(receiver)
+                if not fired:
+                    continue
+                firing += 1
+                if firing <= REACHES_SAMPLE:
+                    names = sorted(str(t) for t in fired)
+                    more = f", … {len(names) - REACHES_SAMPLE} more" if len(names) > REACHES_SAMPLE else ""
+                    text = f"{receiver.receiver} -> {', '.join(names[:REACHES_SAMPLE])}{more}"
+                    item.addChild(QTreeWidgetItem([text]))
+            if firing > REACHES_SAMPLE:
+                item.addChild(QTreeWidgetItem([f"… {firing - REACHES_SAMPLE} more receivers"]))
+            if metrics.triggered:
+                # Large cascades reach thousands of triggers; list only the closest ones
+                nearest = [str(t) for t in cascades.nearest(metrics.trigger, REACHES_SAMPLE)]
+                more = metrics.triggered - len(nearest)
+                text = f"Reaches {metrics.triggered}: {', '.join(nearest)}"
+                item.addChild(QTreeWidgetItem([text + (f", … {more} more" if more > 0 else "")]))
+            self.addTopLevelItem(item)
+        for col in range(self.columnCount()):
+            self.resizeColumnToContents(col)
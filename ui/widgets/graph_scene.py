@@ -1,33 +1,79 @@
 from typing import List
 
-from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtCore import QRectF, Qt, pyqtSignal
 from PyQt6.QtGui import QBrush, QColor, QFont, QPen
 from PyQt6.QtWidgets import QGraphicsScene
 
 from domain.models import Signal
+from domain.query import SignalIndex, SignalQuery
+from ui.widgets.group_item import SignalGroupItem
+
+RENDER_ITEMS = "items"
+RENDER_BATCHED = "batched"
+RENDER_AUTO = "auto"
+# In auto mode, projects with more signals than this are drawn with one item per group
+BATCHED_THRESHOLD = 300
 
 
 class SignalsGraphScene(QGraphicsScene):
-    """Custom QGraphicsScene for rendering Django signals graph."""
+    """
+    Custom QGraphicsScene for rendering Django signals graph.
+    render_mode selects one scene item per shape, label and edge ("items"), one
+    SignalGroupItem per sender group ("batched"), or picks by project size ("auto").
+    nodeSelectionChanged is emitted when the selected node moves within a group item
+    that stays selected.
+    """
+
+    nodeSelectionChanged = pyqtSignal()
 
-    def __init__(self, signals: List[Signal], *args, **kwargs):
+    def __init__(self, signals: List[Signal], *args, render_mode: str = RENDER_AUTO, **kwargs):
         super().__init__(*args, **kwargs)
         self.signals = signals
+        self.render_mode = render_mode
         self.node_items = []
+        self.group_items = []
         self.font = QFont()
         self.font.setPointSize(12)
         self.font.setBold(True)
         self.draw_graph()
 
+    def apply_filter(self, query: SignalQuery, index: SignalIndex):
+        """Redraw the graph with the signals of the index matched by the compiled query."""
+        self.signals = query.filter(index)
+        self.draw_graph()
+
+    def is_batched(self) -> bool:
+        if self.render_mode == RENDER_AUTO:
+            return len(self.signals) > BATCHED_THRESHOLD
+        return self.render_mode == RENDER_BATCHED
+
+    def selected_node(self):
+        """Return the (node_type, node_value) of the selected node in either render mode."""
+        for item in self.selectedItems():
+            if isinstance(item, SignalGroupItem):
+                if item.selected_node is not None:
+                    return item.selected_node.node_type, item.selected_node.value
+            elif item.data(0):
+                return item.data(0)
+        return None
+
     def draw_graph(self):
         self.clear()
         self.node_items = []
+        self.group_items = []
         font = self.font
         # Group signals by sender
         grouped = {}
         for s in self.signals:
             grouped.setdefault(s.sender, []).append(s)
         current_y = 100
+        if self.is_batched():
+            for sender, group in grouped.items():
+                item = SignalGroupItem(sender, group, font, current_y)
+                self.addItem(item)
+                self.group_items.append(item)
+                current_y += item.height + 60
+            return
         for sender, group in grouped.items():
             signals = list({s.name for s in group})
             receivers = list({s.receiver for s in group})
@@ -0,0 +1,196 @@
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from PyQt6.QtCore import QLineF, QPointF, QRectF, Qt
+from PyQt6.QtGui import QBrush, QColor, QFont, QFontMetricsF, QPainter, QPen, QPolygonF, QStaticText
+from PyQt6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+from domain.models import Signal
+
+# QGraphicsTextItem pads its text with a document margin; keep the same metrics so both
+# rendering modes lay groups out identically.
+TEXT_MARGIN = 4
+NODE_VSEP = 70
+NODE_COLORS = {"sender": "#e0f7fa", "signal": "#c8e6c9", "receiver": "#ffe0b2"}
+# Below this zoom level labels are unreadable, so only shapes and edges are painted
+TEXT_MIN_LOD = 0.35
+
+
+class GroupNode(NamedTuple):
+    node_type: str
+    value: str
+    rect: QRectF
+    shape: Optional[QPolygonF]
+    lines: List[Tuple[QPointF, QStaticText]]
+
+
+class SignalGroupItem(QGraphicsItem):
+    """
+    A whole sender group painted as a single scene item.
+    Geometry and static text are computed once; nodes, labels and edges are drawn in one
+    paint() call, and clicks are resolved to nodes internally.
+    """
+
+    def __init__(self, sender: str, group: List[Signal], font: QFont, top: float, parent=None):
+        super().__init__(parent)
+        self.sender = sender
+        self.font = font
+        self.metrics = QFontMetricsF(font)
+        self.selected_node: Optional[GroupNode] = None
+        self.nodes: List[GroupNode] = []
+        self.edges: List[QLineF] = []
+        self._columns: List[Tuple[float, float, List[float], List[GroupNode]]] = []
+        self._layout(group, top)
+        self.setData(0, ("group_rect", sender))
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
+
+    def _text_size(self, name: str) -> Tuple[float, float]:
+        lines = name.split("\n")
+        width = max(self.metrics.horizontalAdvance(line) for line in lines) + 2 * TEXT_MARGIN
+        height = len(lines) * (self.metrics.height() + 2 * TEXT_MARGIN)
+        return width, height
+
+    def _node_width(self, name: str, shape: str) -> float:
+        text_width, _ = self._text_size(name)
+        if shape == "ellipse":
+            return max(80, text_width + 40) * 1.15
+        return max(80, text_width + 20)
+
+    def _add_node(self, node_type: str, value: str, cx: float, cy: float, width: float, shape: str) -> GroupNode:
+        _, text_height = self._text_size(value)
+        height = max(40, text_height + 20)
+        rect = QRectF(cx - width / 2, cy - height / 2, width, height)
+        polygon = None
+        if shape == "diamond":
+            polygon = QPolygonF(
+                [
+                    QPointF(cx, rect.top()),
+                    QPointF(rect.right(), cy),
+                    QPointF(cx, rect.bottom()),
+                    QPointF(rect.left(), cy),
+                ]
+            )
+        lines = []
+        y_offset = cy - text_height / 2 + TEXT_MARGIN
+        for line in value.split("\n"):
+            static = QStaticText(line)
+            static.prepare(font=self.font)
+            lines.append((QPointF(cx - self.metrics.horizontalAdvance(line) / 2, y_offset), static))
+            y_offset += self.metrics.height() + 2 * TEXT_MARGIN
+        node = GroupNode(node_type, value, rect, polygon, lines)
+        self.nodes.append(node)
+        return node
+
+    def _layout(self, group: List[Signal], top: float):
+        signals = list({s.name for s in group})
+        receivers = list({s.receiver for s in group})
+        max_nodes = max(1, len(signals), len(receivers))
+        group_height = max_nodes * NODE_VSEP + 60
+        sender_width = self._node_width(self.sender, "box")
+        max_signal_width = max((self._node_width(sig, "diamond") for sig in signals), default=0)
+        max_receiver_width = max((self._node_width(rec, "ellipse") for rec in receivers), default=0)
+        x0 = 100
+        x_sender = x0 + sender_width / 2
+        x_signal = x_sender + sender_width / 2 + 60 + max_signal_width / 2
+        x_receiver = x_signal + max_signal_width / 2 + 60 + max_receiver_width / 2
+        self.group_rect = QRectF(
+            x0 - 60, top, (x_receiver + max_receiver_width / 2 + 60) - (x0 - 60), group_height
+        )
+        self.label = QStaticText(self.sender)
+        self.label.prepare(font=self.font)
+        self.label_pos = QPointF(x0 - 50 + TEXT_MARGIN, top - 30 + TEXT_MARGIN)
+        label_width, label_height = self._text_size(self.sender)
+        self.label_rect = QRectF(x0 - 50, top - 30, label_width, label_height)
+        self.height = group_height
+
+        node_pos: Dict[str, QPointF] = {}
+        sender_node = self._add_node("sender", self.sender, x_sender, top + group_height // 2, sender_width, "box")
+        node_pos[self.sender] = sender_node.rect.center()
+        self._columns.append((sender_node.rect.left(), sender_node.rect.right(), [sender_node.rect.top()], [sender_node]))
+        for node_type, values, x, width, shape in (
+            ("signal", signals, x_signal, max_signal_width, "diamond"),
+            ("receiver", receivers, x_receiver, max_receiver_width, "ellipse"),
+        ):
+            column = []
+            for i, value in enumerate(values):
+                node = self._add_node(node_type, value, x, top + 40 + i * NODE_VSEP, width, shape)
+                node_pos[value] = node.rect.center()
+                column.append(node)
+            if column:
+                self._columns.append((x - width / 2, x + width / 2, [n.rect.top() for n in column], column))
+        for s in group:
+            if s.sender in node_pos and s.name in node_pos:
+                self.edges.append(QLineF(node_pos[s.sender], node_pos[s.name]))
+            if s.name in node_pos and s.receiver in node_pos:
+                self.edges.append(QLineF(node_pos[s.name], node_pos[s.receiver]))
+        self._bounds = self.group_rect.united(self.label_rect).adjusted(-2, -2, 2, 2)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def node_at(self, pos: QPointF) -> Optional[GroupNode]:
+        """Return the node under an item-local position, if any."""
+        for left, right, tops, column in self._columns:
+            if not left <= pos.x() <= right:
+                continue
+            i = bisect_right(tops, pos.y()) - 1
+            if i < 0:
+                return None
+            node = column[i]
+            if node.shape is not None:
+                return node if node.shape.containsPoint(pos, Qt.FillRule.OddEvenFill) else None
+            if node.node_type == "receiver":
+                dx = (pos.x() - node.rect.center().x()) / (node.rect.width() / 2)
+                dy = (pos.y() - node.rect.center().y()) / (node.rect.height() / 2)
+                return node if dx * dx + dy * dy <= 1 else None
+            return node if node.rect.contains(pos) else None
+        return None
+
+    def mousePressEvent(self, event):
+        # Only the left button selects, as with plain node items
+        node = self.node_at(event.pos()) if event.button() == Qt.MouseButton.LeftButton else None
+        if node is None:
+            event.ignore()
+            return
+        moved = self.isSelected() and node is not self.selected_node
+        self.selected_node = node
+        # Default handling keeps Ctrl multi-selection and clears other items' selection
+        super().mousePressEvent(event)
+        self.update()
+        scene = self.scene()
+        if moved and self.isSelected() and scene is not None:
+            # Item selection did not change, so selectionChanged will not fire
+            scene.nodeSelectionChanged.emit()
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.GraphicsItemChange.ItemSelectedHasChanged and not value:
+            self.update()
+        return super().itemChange(change, value)
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget=None):
+        painter.setPen(QPen(Qt.GlobalColor.darkGray, 2, Qt.PenStyle.DashLine))
+        painter.setBrush(QBrush(QColor(240, 240, 255, 60)))
+        painter.drawRect(self.group_rect)
+        painter.setPen(QPen(QColor(120, 160, 255), 2))
+        painter.drawLines(self.edges)
+        selected = self.selected_node if self.isSelected() else None
+        node_pen = QPen(Qt.GlobalColor.black)
+        selected_pen = QPen(Qt.GlobalColor.black, 1, Qt.PenStyle.DashLine)
+        for node in self.nodes:
+            painter.setPen(selected_pen if node is selected else node_pen)
+            painter.setBrush(QBrush(QColor(NODE_COLORS[node.node_type])))
+            if node.node_type == "sender":
+                painter.drawRect(node.rect)
+            elif node.shape is not None:
+                painter.drawPolygon(node.shape)
+            else:
+                painter.drawEllipse(node.rect)
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < TEXT_MIN_LOD:
+            return
+        painter.setFont(self.font)
+        painter.setPen(Qt.GlobalColor.black)
+        for node in self.nodes:
+            for pos, static in node.lines:
+                painter.drawStaticText(pos, static)
+        painter.setPen(QColor(80, 100, 180))
+        painter.drawStaticText(self.label_pos, self.label)